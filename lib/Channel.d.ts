@@ -6,6 +6,7 @@ export declare class Channel extends EnhancedEventEmitter {
     private _nextId;
     private readonly _sents;
     private _recvBuffer?;
+    private _binaryNotification?;
     constructor({ sendSocket, recvSocket, pid }: {
         sendSocket: any;
         recvSocket: any;
@@ -14,6 +15,12 @@ export declare class Channel extends EnhancedEventEmitter {
     close(): void;
     request(method: string, internal?: object, data?: any): Promise<any>;
     notify(event: string, internal?: object, data?: any): any;
+    /**
+     * Send a notification whose data is a binary payload. It is written as a
+     * JSON netstring with a `binary` flag followed by a netstring with the raw
+     * payload.
+     */
+    notifyBinary(event: string, internal: object, data: Buffer): any;
     private _processMessage;
 }
 //# sourceMappingURL=Channel.d.ts.map
\ No newline at end of file
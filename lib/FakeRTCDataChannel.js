@@ -98,10 +98,10 @@ class FakeRTCDataChannel extends event_target_shim_1.EventTarget {
         }
         else if (data instanceof ArrayBuffer) {
             const buffer = Buffer.from(data);
-            this._channel.notify('datachannel.sendBinary', this._internal, buffer.toString('base64'));
+            this._channel.notifyBinary('datachannel.sendBinary', this._internal, buffer);
         }
         else if (data instanceof Buffer) {
-            this._channel.notify('datachannel.sendBinary', this._internal, data.toString('base64'));
+            this._channel.notifyBinary('datachannel.sendBinary', this._internal, data);
         }
         else {
             throw new TypeError('invalid data type');
@@ -134,17 +134,15 @@ class FakeRTCDataChannel extends event_target_shim_1.EventTarget {
                     }
                 case 'binary':
                     {
-                        const buffer = Buffer.from(data, 'utf-8');
-                        const arrayBuffer = new ArrayBuffer(buffer.length);
-                        const view = new Uint8Array(arrayBuffer);
-                        for (let i = 0; i < buffer.length; ++i) {
-                            view[i] = buffer[i];
-                        }
+                        const buffer = data;
+                        const arrayBuffer = buffer.buffer.slice(buffer.byteOffset, buffer.byteOffset + buffer.byteLength);
                         this.dispatchEvent({ type: 'message', data: arrayBuffer });
                         break;
                     }
                 case 'bufferedamountlow':
                     {
+                        if (typeof data === 'number')
+                            this._bufferedAmount = data;
                         this.dispatchEvent({ type: 'bufferedamountlow' });
                         break;
                     }
@@ -25,6 +25,18 @@ const uuid_1 = require("uuid");
 const fake_mediastreamtrack_1 = require("fake-mediastreamtrack");
 const utils_1 = require("mediasoup-client/lib/utils");
 const AiortcMediaStream_1 = require("./AiortcMediaStream");
+// platform dependent device defaults, resolved once at load time.
+const deviceDefaults = os.platform() === 'darwin'
+    ? {
+        audio: { file: 'none:0', format: 'avfoundation' },
+        // eslint-disable-next-line @typescript-eslint/camelcase
+        video: { file: 'default:none', format: 'avfoundation', options: { framerate: '30', video_size: '640x480' } }
+    }
+    : {
+        audio: { file: 'hw:0', format: 'alsa' },
+        // eslint-disable-next-line @typescript-eslint/camelcase
+        video: { file: '/dev/video0', format: 'v4l2', options: { framerate: '30', video_size: '640x480' } }
+    };
 async function getUserMedia(channel, constraints = {}) {
     constraints = utils_1.clone(constraints);
     let { audio, video } = constraints;
@@ -42,24 +54,13 @@ async function getUserMedia(channel, constraints = {}) {
         switch (audio.source) {
             case 'device':
                 {
-                    if (os.platform() === 'darwin') {
-                        audioPlayerOptions =
-                            {
-                                source: 'device',
-                                file: audio.device || 'none:0',
-                                format: audio.format || 'avfoundation',
-                                options: audio.options
-                            };
-                    }
-                    else {
-                        audioPlayerOptions =
-                            {
-                                source: 'device',
-                                file: audio.device || 'hw:0',
-                                format: audio.format || 'alsa',
-                                options: audio.options
-                            };
-                    }
+                    audioPlayerOptions =
+                        {
+                            source: 'device',
+                            file: audio.device || deviceDefaults.audio.file,
+                            format: audio.format || deviceDefaults.audio.format,
+                            options: audio.options
+                        };
                     break;
                 }
             case 'file':
@@ -99,26 +100,13 @@ async function getUserMedia(channel, constraints = {}) {
         switch (video.source) {
             case 'device':
                 {
-                    if (os.platform() === 'darwin') {
-                        videoPlayerOptions =
-                            {
-                                source: 'device',
-                                file: video.device || 'default:none',
-                                format: video.format || 'avfoundation',
-                                // eslint-disable-next-line @typescript-eslint/camelcase
-                                options: video.options || { framerate: '30', video_size: '640x480' }
-                            };
-                    }
-                    else {
-                        videoPlayerOptions =
-                            {
-                                source: 'device',
-                                file: video.device || '/dev/video0',
-                                format: video.format || 'v4l2',
-                                // eslint-disable-next-line @typescript-eslint/camelcase
-                                options: video.options || { framerate: '30', video_size: '640x480' }
-                            };
-                    }
+                    videoPlayerOptions =
+                        {
+                            source: 'device',
+                            file: video.device || deviceDefaults.video.file,
+                            format: video.format || deviceDefaults.video.format,
+                            options: video.options || deviceDefaults.video.options
+                        };
                     break;
                 }
             case 'file':
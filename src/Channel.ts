@@ -35,6 +35,8 @@ export class Channel extends EnhancedEventEmitter
 	private readonly _sents: Map<number, Sent> = new Map();
 	// Buffer for reading messages from the worker.
 	private _recvBuffer?: Buffer;
+	// Binary notification from the worker waiting for its payload.
+	private _binaryNotification?: { targetId: string; event: string };
 
 	constructor(
 		{
@@ -73,8 +75,9 @@ export class Channel extends EnhancedEventEmitter
 			{
 				logger.error('receiving buffer is full, discarding all data into it');
 
-				// Reset the buffer and exit.
+				// Reset the buffer and any pending binary notification and exit.
 				this._recvBuffer = null;
+				this._binaryNotification = undefined;
 
 				return;
 			}
@@ -93,8 +96,9 @@ export class Channel extends EnhancedEventEmitter
 						'invalid netstring data received from the worker process: %s',
 						String(error));
 
-					// Reset the buffer and exit.
+					// Reset the buffer and any pending binary notification and exit.
 					this._recvBuffer = undefined;
+					this._binaryNotification = undefined;
 
 					return;
 				}
@@ -103,9 +107,17 @@ export class Channel extends EnhancedEventEmitter
 				if (nsPayload === -1)
 					return;
 
-				// We only expect JSON messages (Channel messages).
+				// Raw payload of the previous binary notification.
+				if (this._binaryNotification)
+				{
+					const { targetId, event } = this._binaryNotification;
+
+					this._binaryNotification = undefined;
+					this.emit(targetId, event, nsPayload);
+				}
+				// Otherwise we only expect JSON messages (Channel messages).
 				// 123 = '{' (a Channel JSON messsage).
-				if (nsPayload[0] === 123)
+				else if (nsPayload[0] === 123)
 				{
 					this._processMessage(JSON.parse(nsPayload));
 				}
@@ -282,6 +294,47 @@ export class Channel extends EnhancedEventEmitter
 		}
 	}
 
+	/**
+	 * Send a notification whose data is a binary payload. It is written as a
+	 * JSON netstring with a `binary` flag followed by a netstring with the raw
+	 * payload.
+	 */
+	notifyBinary(event: string, internal: object, data: Buffer): any
+	{
+		logger.debug('notifyBinary() [event:%s]', event);
+
+		if (this._closed)
+		{
+			logger.warn('notifyBinary() | Channel closed');
+
+			return;
+		}
+
+		if (data.length > NS_PAYLOAD_MAX_LEN)
+		{
+			logger.error(
+				'notifyBinary() | notification too big [length:%s]', data.length);
+
+			return;
+		}
+
+		const notification = { event, internal, binary: true };
+		const ns = netstring.nsWrite(JSON.stringify(notification));
+
+		// This may throw if closed or remote side ended.
+		try
+		{
+			this._sendSocket.write(ns);
+			this._sendSocket.write(`${data.length}:`);
+			this._sendSocket.write(data);
+			this._sendSocket.write(',');
+		}
+		catch (error)
+		{
+			logger.warn('notifyBinary() | failed: %s', String(error));
+		}
+	}
+
 	private _processMessage(msg: any): void
 	{
 		// If a response retrieve its associated request.
@@ -330,7 +383,11 @@ export class Channel extends EnhancedEventEmitter
 		// If a notification emit it to the corresponding entity.
 		else if (msg.event)
 		{
-			this.emit(msg.targetId, msg.event, msg.data);
+			// A binary notification is followed by its raw payload.
+			if (msg.binary)
+				this._binaryNotification = { targetId: msg.targetId, event: msg.event };
+			else
+				this.emit(msg.targetId, msg.event, msg.data);
 		}
 		// Otherwise unexpected message.
 		else
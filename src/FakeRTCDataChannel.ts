@@ -194,13 +194,13 @@ export class FakeRTCDataChannel extends EventTarget implements RTCDataChannel
 		{
 			const buffer = Buffer.from(data);
 
-			this._channel.notify(
-				'datachannel.sendBinary', this._internal, buffer.toString('base64'));
+			this._channel.notifyBinary(
+				'datachannel.sendBinary', this._internal, buffer);
 		}
 		else if (data instanceof Buffer)
 		{
-			this._channel.notify(
-				'datachannel.sendBinary', this._internal, data.toString('base64'));
+			this._channel.notifyBinary(
+				'datachannel.sendBinary', this._internal, data);
 		}
 		else
 		{
@@ -248,14 +248,9 @@ export class FakeRTCDataChannel extends EventTarget implements RTCDataChannel
 
 				case 'binary':
 				{
-					const buffer = Buffer.from(data, 'utf-8');
-					const arrayBuffer = new ArrayBuffer(buffer.length);
-					const view = new Uint8Array(arrayBuffer);
-
-					for (let i = 0; i < buffer.length; ++i)
-					{
-						view[i] = buffer[i];
-					}
+					const buffer = data as Buffer;
+					const arrayBuffer = buffer.buffer.slice(
+						buffer.byteOffset, buffer.byteOffset + buffer.byteLength);
 
 					this.dispatchEvent({ type: 'message', data: arrayBuffer });
 
@@ -264,6 +259,9 @@ export class FakeRTCDataChannel extends EventTarget implements RTCDataChannel
 
 				case 'bufferedamountlow':
 				{
+					if (typeof data === 'number')
+						this._bufferedAmount = data;
+
 					this.dispatchEvent({ type: 'bufferedamountlow' });
 
 					break;
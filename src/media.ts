@@ -36,6 +36,27 @@ type MediaPlayerOptions =
 	options?: object;
 };
 
+type DeviceDefaults =
+{
+	file: string;
+	format: string;
+	options?: object;
+};
+
+// platform dependent device defaults, resolved once at load time.
+const deviceDefaults: { audio: DeviceDefaults; video: DeviceDefaults } =
+	os.platform() === 'darwin'
+		? {
+			audio : { file: 'none:0', format: 'avfoundation' },
+			// eslint-disable-next-line @typescript-eslint/camelcase
+			video : { file: 'default:none', format: 'avfoundation', options: { framerate: '30', video_size: '640x480' } }
+		}
+		: {
+			audio : { file: 'hw:0', format: 'alsa' },
+			// eslint-disable-next-line @typescript-eslint/camelcase
+			video : { file: '/dev/video0', format: 'v4l2', options: { framerate: '30', video_size: '640x480' } }
+		};
+
 export async function getUserMedia(
 	channel: Channel,
 	constraints: AiortcMediaStreamConstraints = {}
@@ -64,26 +85,13 @@ export async function getUserMedia(
 		{
 			case 'device':
 			{
-				if (os.platform() === 'darwin')
-				{
-					audioPlayerOptions =
-					{
-						source  : 'device',
-						file    : audio.device || 'none:0',
-						format  : audio.format || 'avfoundation',
-						options : audio.options
-					};
-				}
-				else
+				audioPlayerOptions =
 				{
-					audioPlayerOptions =
-					{
-						source  : 'device',
-						file    : audio.device || 'hw:0',
-						format  : audio.format || 'alsa',
-						options : audio.options
-					};
-				}
+					source  : 'device',
+					file    : audio.device || deviceDefaults.audio.file,
+					format  : audio.format || deviceDefaults.audio.format,
+					options : audio.options
+				};
 
 				break;
 			}
@@ -136,28 +144,13 @@ export async function getUserMedia(
 		{
 			case 'device':
 			{
-				if (os.platform() === 'darwin')
-				{
-					videoPlayerOptions =
-					{
-						source  : 'device',
-						file    : video.device || 'default:none',
-						format  : video.format || 'avfoundation',
-						// eslint-disable-next-line @typescript-eslint/camelcase
-						options : video.options || { framerate: '30', video_size: '640x480' }
-					};
-				}
-				else
+				videoPlayerOptions =
 				{
-					videoPlayerOptions =
-					{
-						source  : 'device',
-						file    : video.device || '/dev/video0',
-						format  : video.format || 'v4l2',
-						// eslint-disable-next-line @typescript-eslint/camelcase
-						options : video.options || { framerate: '30', video_size: '640x480' }
-					};
-				}
+					source  : 'device',
+					file    : video.device || deviceDefaults.video.file,
+					format  : video.format || deviceDefaults.video.format,
+					options : video.options || deviceDefaults.video.options
+				};
 
 				break;
 			}
@@ -2,6 +2,7 @@ const { toBeType } = require('jest-tobetype');
 const pkg = require('../package.json');
 const { Device } = require('mediasoup-client');
 const { version, createWorker } = require('../');
+const { FakeRTCDataChannel } = require('../lib/FakeRTCDataChannel');
 const fakeParameters = require('./fakeParameters');
 
 expect.extend({ toBeType });
@@ -865,6 +866,165 @@ test('dataConsumer.close() succeed', () =>
 	expect(dataConsumer.closed).toBe(true);
 }, 500);
 
+test('binary DataChannel messages are sent and received through the worker', async () =>
+{
+	// Connect two handlers in the worker to each other so messages sent on a
+	// DataChannel are received on the other one.
+	const channel = worker._channel;
+	const internals = [ { handlerId: 'binary-test-1' }, { handlerId: 'binary-test-2' } ];
+	const dataChannels = [];
+
+	for (const internal of internals)
+	{
+		await channel.request('createHandler', internal, { rtcConfiguration: {} });
+
+		const dataChannelInternal =
+			{ ...internal, dataChannelId: `${internal.handlerId}-datachannel` };
+		const options = { id: 0, ordered: true, label: 'FOO', protocol: '' };
+		const result = await channel.request(
+			'handler.createDataChannel', dataChannelInternal, options);
+
+		dataChannels.push(
+			new FakeRTCDataChannel(
+				dataChannelInternal,
+				channel,
+				{
+					id       : result.streamId,
+					ordered  : result.ordered,
+					label    : result.label,
+					protocol : result.protocol
+				},
+				result));
+	}
+
+	const offer = await channel.request('handler.createOffer', internals[0]);
+
+	await channel.request('handler.setLocalDescription', internals[0], offer);
+	await channel.request(
+		'handler.setRemoteDescription',
+		internals[1],
+		await channel.request('handler.getLocalDescription', internals[0]));
+
+	const answer = await channel.request('handler.createAnswer', internals[1]);
+
+	await channel.request('handler.setLocalDescription', internals[1], answer);
+	await channel.request(
+		'handler.setRemoteDescription',
+		internals[0],
+		await channel.request('handler.getLocalDescription', internals[1]));
+
+	await Promise.all(dataChannels.map((dataChannel) => new Promise((resolve) =>
+	{
+		if (dataChannel.readyState === 'open')
+			resolve();
+		else
+			dataChannel.addEventListener('open', resolve);
+	})));
+
+	const received = [];
+	const receivedAll = new Promise((resolve) =>
+	{
+		dataChannels[1].addEventListener('message', ({ data }) =>
+		{
+			received.push(data);
+
+			if (received.length === 4)
+				resolve();
+		});
+	});
+
+	// A JSON looking payload, a large one, an ArrayBuffer and an empty one.
+	dataChannels[0].send(Buffer.from('{"foo":"bar"}'));
+	dataChannels[0].send(Buffer.alloc(60000, 7));
+	dataChannels[0].send(new Uint8Array([ 1, 2, 3 ]).buffer);
+	dataChannels[0].send(Buffer.alloc(0));
+
+	await receivedAll;
+
+	expect(received.every((data) => data instanceof ArrayBuffer)).toBe(true);
+	expect(Buffer.from(received[0]).toString()).toBe('{"foo":"bar"}');
+	expect(Buffer.from(received[1]).equals(Buffer.alloc(60000, 7))).toBe(true);
+	expect(Array.from(new Uint8Array(received[2]))).toEqual([ 1, 2, 3 ]);
+	expect(received[3].byteLength).toBe(0);
+
+	for (const dataChannel of dataChannels)
+	{
+		dataChannel.close();
+	}
+
+	for (const internal of internals)
+	{
+		channel.notify('handler.close', internal);
+	}
+}, 10000);
+
+test('device players are shared and released by the worker', async () =>
+{
+	// A device player is shared by every user of the same device, so use a
+	// file as the device.
+	const channel = worker._channel;
+	const options = { source: 'device', file: 'test/small.mp4' };
+	const createPlayer = (playerId) =>
+		channel.request('createPlayer', { playerId }, options);
+	const stopTrack = (playerId, kind) =>
+		channel.notify('player.stopTrack', { playerId }, { kind });
+	const getReadyStates = async () =>
+	{
+		const { players } = await worker.dump();
+		const readyStates = {};
+
+		for (const { id, audioTrack, videoTrack } of players)
+		{
+			readyStates[id] = [ audioTrack.readyState, videoTrack.readyState ];
+		}
+
+		return readyStates;
+	};
+
+	const resultA = await createPlayer('device-test-a');
+	const resultB = await createPlayer('device-test-b');
+
+	// Each user gets its own relayed tracks.
+	expect(resultA.audioTrackId).toBeType('string');
+	expect(resultA.videoTrackId).toBeType('string');
+	expect(resultB.audioTrackId).not.toBe(resultA.audioTrackId);
+	expect(resultB.videoTrackId).not.toBe(resultA.videoTrackId);
+
+	// Stopping a track of a user does not stop the one of the other user.
+	stopTrack('device-test-a', 'video');
+
+	expect(await getReadyStates()).toEqual(
+		{
+			'device-test-a' : [ 'live', 'ended' ],
+			'device-test-b' : [ 'live', 'live' ]
+		});
+
+	// Once every user stopped the video the player is not shared anymore, so
+	// a new user gets a new player.
+	stopTrack('device-test-b', 'video');
+
+	const resultD = await createPlayer('device-test-d');
+
+	expect(resultD.videoTrackId).toBeType('string');
+
+	stopTrack('device-test-a', 'audio');
+	stopTrack('device-test-b', 'audio');
+
+	expect(await getReadyStates()).toEqual(
+		{
+			'device-test-a' : [ 'ended', 'ended' ],
+			'device-test-b' : [ 'ended', 'ended' ],
+			'device-test-d' : [ 'live', 'live' ]
+		});
+
+	for (const playerId of [ 'device-test-a', 'device-test-b', 'device-test-d' ])
+	{
+		channel.notify('player.close', { playerId });
+	}
+
+	expect(await getReadyStates()).toEqual({});
+}, 5000);
+
 test('worker.close() succeeds', () =>
 {
 	worker.close();
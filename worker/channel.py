@@ -3,13 +3,28 @@ import json
 import socket
 import pynetstring
 from asyncio import StreamReader, StreamWriter
-from typing import Any, Dict, Optional, Union
+from collections import deque
+from typing import Any, Deque, Dict, Optional, Union
 
 from logger import Logger
 
+try:
+    # C accelerated JSON encoding/decoding if available, it produces bytes
+    from orjson import dumps, loads
+except ImportError:
+    def dumps(obj: Any) -> bytes:  # type: ignore
+        return json.dumps(obj).encode("utf8")
+
+    loads = json.loads  # type: ignore
+
+
+def _netstring(data: bytes) -> bytes:
+    # frame the payload with a single allocation
+    return b"%d:%s," % (len(data), data)
+
 
 def object_from_string(message_str) -> Optional[Dict[str, Any]]:
-    message = json.loads(message_str)
+    message = loads(message_str)
 
     if "method" in message:
         if "id" in message:
@@ -41,6 +56,10 @@ class Channel:
         self._reader = Union[StreamReader, None]
         self._writer = Union[StreamWriter, None]
         self._nsDecoder = pynetstring.Decoder()
+        # decoded netstring payloads not processed yet
+        self._nsPayloads: Deque[bytes] = deque()
+        # binary message header waiting for its raw payload
+        self._binaryMessage: Optional[Dict[str, Any]] = None
         self._connected = False
 
     async def _connect(self) -> None:
@@ -70,38 +89,57 @@ class Channel:
         await self._connect()
 
         try:
-            # retrieve chunks of 50 bytes
-            data = await self._reader.read(50)
-            if len(data) == 0:
-                Logger.debug("channel: socket closed, exiting")
-                raise Exception("socket closed")
+            if not self._nsPayloads:
+                # retrieve chunks of up to 64 KiB
+                data = await self._reader.read(65536)
+                if len(data) == 0:
+                    Logger.debug("channel: socket closed, exiting")
+                    raise Exception("socket closed")
+
+                self._nsPayloads.extend(self._nsDecoder.feed(data))
 
-            decoded_list = self._nsDecoder.feed(data)
-            for item in decoded_list:
-                return object_from_string(item.decode("utf8"))
+            while self._nsPayloads:
+                payload = self._nsPayloads.popleft()
+
+                # raw payload of the previous binary message header
+                if self._binaryMessage is not None:
+                    message = self._binaryMessage
+                    self._binaryMessage = None
+                    message["data"] = payload
+                    return message
+
+                message = object_from_string(payload)
+
+                # a binary message header is followed by a netstring with
+                # the raw payload
+                if message is not None and message.pop("binary", False):
+                    self._binaryMessage = message
+                    continue
+
+                return message
 
         except asyncio.IncompleteReadError:
             pass
 
         return None
 
-    async def send(self, descr) -> None:
-        await self._connect()
+    async def send(self, data: bytes) -> None:
+        await self._write(_netstring(data))
 
-        data = descr.encode("utf8")
-        data = pynetstring.encode(data)
+    async def _write(self, frame: bytes) -> None:
+        await self._connect()
 
-        self._writer.write(data)
+        self._writer.write(frame)
 
     async def notify(self, targetId: str, event: str, data=None) -> None:
         try:
             if data is not None:
                 await self.send(
-                    json.dumps({"targetId": targetId, "event": event, "data": data})
+                    dumps({"targetId": targetId, "event": event, "data": data})
                 )
             else:
                 await self.send(
-                    json.dumps({"targetId": targetId, "event": event})
+                    dumps({"targetId": targetId, "event": event})
                 )
 
         except Exception as error:
@@ -110,6 +148,21 @@ class Channel:
                 f"channel: notify() failed [targetId:{targetId}, event:{event}]]: {errorStr}"
             )
 
+    async def notifyBinary(self, targetId: str, event: str, data: bytes) -> None:
+        try:
+            header = dumps(
+                {"targetId": targetId, "event": event, "binary": True})
+
+            # header and raw payload netstrings go out in a single write
+            await self._write(
+                b"%d:%s,%d:%s," % (len(header), header, len(data), data))
+
+        except Exception as error:
+            errorStr = f"{error.__class__.__name__}: {error}"
+            Logger.warning(
+                f"channel: notifyBinary() failed [targetId:{targetId}, event:{event}]]: {errorStr}"
+            )
+
 
 """
 Request class
@@ -128,27 +181,27 @@ class Request:
 
     async def succeed(self, data=None) -> None:
         if data is not None:
-            await self._channel.send(json.dumps({
+            await self._channel.send(dumps({
                 "id": self._id,
                 "accepted": True,
                 "data": data
-            }, sort_keys=True))
+            }))
         else:
-            await self._channel.send(json.dumps({
+            await self._channel.send(dumps({
                 "id": self._id,
                 "accepted": True
-            }, sort_keys=True))
+            }))
 
     async def failed(self, error) -> None:
         errorType = "Error"
         if isinstance(error, TypeError):
             errorType = "TypeError"
 
-        await self._channel.send(json.dumps({
+        await self._channel.send(dumps({
             "id": self._id,
             "error": errorType,
             "reason": f"{error.__class__.__name__}: {error}"
-        }, sort_keys=True))
+        }))
 
 
 """
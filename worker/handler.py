@@ -1,6 +1,7 @@
-from typing import Any, Dict, Optional
-import base64
+from typing import Any, Awaitable, Callable, Dict, Optional
 import asyncio
+from datetime import datetime
+from functools import lru_cache
 from aiortc import (
     RTCConfiguration,
     RTCDataChannel,
@@ -14,6 +15,30 @@ from channel import Request, Notification, Channel
 from logger import Logger
 
 
+def _toSessionDescription(data: Any) -> RTCSessionDescription:
+    if isinstance(data, RTCSessionDescription):
+        return data
+
+    try:
+        sdp = data["sdp"]
+    except KeyError:
+        raise TypeError("missing data.sdp")
+    try:
+        sdpType = data["type"]
+    except KeyError:
+        raise TypeError("missing data.type")
+
+    return RTCSessionDescription(sdp=sdp, type=sdpType)
+
+
+# remote stats keep the same datetime until a new RTCP report is received so
+# their conversion is memoized across stats requests, local stats get a fresh
+# datetime each time and must not go through this cache
+@lru_cache(maxsize=256)
+def _toRemoteTimestamp(value: datetime) -> float:
+    return value.timestamp()
+
+
 class Handler:
     def __init__(
         self,
@@ -30,14 +55,61 @@ class Handler:
         self._pc = RTCPeerConnection(configuration or None)
         # dictionary of sending transceivers mapped by given localId
         self._sendTransceivers = dict()  # type: Dict[str, RTCRtpTransceiver]
+        # dictionary of transceivers mapped by MID
+        self._transceiversByMid = dict()  # type: Dict[str, RTCRtpTransceiver]
         # dictionary of dataChannelds mapped by internal id
         self._dataChannels = dict()  # type: Dict[str, RTCDataChannel]
+        # dictionary of last notified bufferedAmount mapped by dataChannel id
+        self._notifiedBufferedAmounts = dict()  # type: Dict[str, int]
         # function returning a sending track given a player id and a kind
         self._getTrack = getTrack
         # function to store a receiving track
         self._addRemoteTrack = addRemoteTrack
         # function returning a receiving track
         self._getRemoteTrack = getRemoteTrack
+        # stats serializers mapped by stats type
+        self._statsSerializers: Dict[str, Callable[[RTCStatsReport], Dict[str, Any]]] = {
+            "inbound-rtp": self._serializeInboundStats,
+            "outbound-rtp": self._serializeOutboundStats,
+            "remote-inbound-rtp": self._serializeRemoteInboundStats,
+            "remote-outbound-rtp": self._serializeRemoteOutboundStats,
+            "transport": self._serializeTransportStats
+        }
+        # subset of stats serializers for sender stats
+        self._senderStatsSerializers = {
+            type: self._statsSerializers[type]
+            for type in ["outbound-rtp", "remote-inbound-rtp", "transport"]
+        }
+        # subset of stats serializers for receiver stats
+        self._receiverStatsSerializers = {
+            type: self._statsSerializers[type]
+            for type in ["inbound-rtp", "remote-outbound-rtp", "transport"]
+        }
+        # request handlers mapped by request method
+        self._requestHandlers: Dict[str, Callable[[Request], Awaitable[Any]]] = {
+            "handler.getLocalDescription": self._getLocalDescription,
+            "handler.createOffer": self._createOffer,
+            "handler.createAnswer": self._createAnswer,
+            "handler.setLocalDescription": self._setLocalDescription,
+            "handler.setRemoteDescription": self._setRemoteDescription,
+            "handler.getMid": self._getMid,
+            "handler.addTrack": self._addTrack,
+            "handler.removeTrack": self._removeTrack,
+            "handler.replaceTrack": self._replaceTrack,
+            "handler.getTransportStats": self._getTransportStats,
+            "handler.getSenderStats": self._getSenderStats,
+            "handler.getReceiverStats": self._getReceiverStats,
+            "handler.createDataChannel": self._createDataChannel
+        }
+        # notification handlers mapped by notification event
+        self._notificationHandlers: Dict[str, Callable[[Notification], Awaitable[None]]] = {
+            "enableTrack": self._enableTrack,
+            "disableTrack": self._disableTrack,
+            "datachannel.send": self._dataChannelSend,
+            "datachannel.sendBinary": self._dataChannelSendBinary,
+            "datachannel.close": self._dataChannelClose,
+            "datachannel.setBufferedAmountLowThreshold": self._dataChannelSetBufferedAmountLowThreshold
+        }
 
         @self._pc.on("track")  # type: ignore
         def on_track(track) -> None:
@@ -79,20 +151,7 @@ class Handler:
                 self._pc.iceConnectionState
             )
 
-        async def checkDataChannelsBufferedAmount() -> None:
-            while True:
-                await asyncio.sleep(1)
-                for dataChannelId, dataChannel in self._dataChannels.items():
-                    await self._channel.notify(dataChannelId, "bufferedamount", dataChannel.bufferedAmount)
-
-        self._dataChannelsBufferedAmountTask = loop.create_task(
-            checkDataChannelsBufferedAmount()
-        )
-
     async def close(self) -> None:
-        # stop the periodic task
-        self._dataChannelsBufferedAmountTask.cancel()
-
         # close peerconnection
         await self._pc.close()
 
@@ -132,325 +191,359 @@ class Handler:
         return result
 
     async def processRequest(self, request: Request) -> Any:
-        if request.method == "handler.getLocalDescription":
-            localDescription = self._pc.localDescription
-            if (localDescription is not None):
-                return {
-                    "type": localDescription.type,
-                    "sdp": localDescription.sdp
-                }
-            else:
-                return None
-
-        elif request.method == "handler.createOffer":
-            offer = await self._pc.createOffer()
-            return {
-                "type": offer.type,
-                "sdp": offer.sdp
-            }
-
-        elif request.method == "handler.createAnswer":
-            answer = await self._pc.createAnswer()
-            return {
-                "type": answer.type,
-                "sdp": answer.sdp
-            }
+        requestHandler = self._requestHandlers.get(request.method)
+        if requestHandler is None:
+            raise TypeError("unknown request method")
 
-        elif request.method == "handler.setLocalDescription":
-            data = request.data
-            if isinstance(data, RTCSessionDescription):
-                raise TypeError("request data not a RTCSessionDescription")
+        return await requestHandler(request)
 
-            description = RTCSessionDescription(**data)
-            await self._pc.setLocalDescription(description)
+    async def processNotification(self, notification: Notification) -> None:
+        notificationHandler = self._notificationHandlers.get(notification.event)
+        if notificationHandler is None:
+            raise TypeError("unknown notification event")
 
-        elif request.method == "handler.setRemoteDescription":
-            data = request.data
-            if isinstance(data, RTCSessionDescription):
-                raise TypeError("request data not a RTCSessionDescription")
+        await notificationHandler(notification)
 
-            description = RTCSessionDescription(**data)
-            await self._pc.setRemoteDescription(description)
+    """
+    Request handlers
+    """
 
-        elif request.method == "handler.getMid":
-            data = request.data
-            localId = data.get("localId")
-            if localId is None:
-                raise TypeError("missing data.localId")
+    async def _getLocalDescription(self, request: Request) -> Any:
+        localDescription = self._pc.localDescription
+        if (localDescription is not None):
+            return {
+                "type": localDescription.type,
+                "sdp": localDescription.sdp
+            }
+        else:
+            return None
 
-            # raise on purpose if the key is not found
-            transceiver = self._sendTransceivers[localId]
-            return transceiver.mid
+    async def _createOffer(self, request: Request) -> Any:
+        offer = await self._pc.createOffer()
+        return {
+            "type": offer.type,
+            "sdp": offer.sdp
+        }
 
-        elif request.method == "handler.addTrack":
-            data = request.data
-            localId = data.get("localId")
-            if localId is None:
-                raise TypeError("missing data.localId")
+    async def _createAnswer(self, request: Request) -> Any:
+        answer = await self._pc.createAnswer()
+        return {
+            "type": answer.type,
+            "sdp": answer.sdp
+        }
 
+    async def _setLocalDescription(self, request: Request) -> Any:
+        description = _toSessionDescription(request.data)
+        await self._pc.setLocalDescription(description)
+        self._updateTransceiversByMid()
+
+    async def _setRemoteDescription(self, request: Request) -> Any:
+        description = _toSessionDescription(request.data)
+        await self._pc.setRemoteDescription(description)
+        self._updateTransceiversByMid()
+
+    async def _getMid(self, request: Request) -> Any:
+        data = request.data
+        try:
+            localId = data["localId"]
+        except KeyError:
+            raise TypeError("missing data.localId")
+
+        # raise on purpose if the key is not found
+        transceiver = self._sendTransceivers[localId]
+        return transceiver.mid
+
+    async def _addTrack(self, request: Request) -> Any:
+        data = request.data
+        try:
+            localId = data["localId"]
+        except KeyError:
+            raise TypeError("missing data.localId")
+        try:
             kind = data["kind"]
-            playerId = data.get("playerId")
-            recvTrackId = data.get("recvTrackId")
-
-            # sending a track got from a MediaPlayer
-            if playerId:
-                track = self._getTrack(playerId, kind)
-                transceiver = self._pc.addTransceiver(track)
-
-            # sending a track which is a remote/receiving track
-            elif recvTrackId:
-                track = self._getRemoteTrack(recvTrackId, kind)
-                transceiver = self._pc.addTransceiver(track)
-
-            else:
-                raise TypeError("missing data.playerId or data.recvTrackId")
-
-            # store transceiver in the dictionary
-            self._sendTransceivers[localId] = transceiver
-
-        elif request.method == "handler.removeTrack":
-            data = request.data
-            localId = data.get("localId")
-            if localId is None:
-                raise TypeError("missing data.localId")
-
-            transceiver = self._sendTransceivers[localId]
-            transceiver.direction = "inactive"
-            transceiver.sender.replaceTrack(None)
+        except KeyError:
+            raise TypeError("missing data.kind")
+        playerId = data.get("playerId")
+        recvTrackId = data.get("recvTrackId")
 
-            # NOTE: do not remove transceiver from the dictionary
+        # sending a track got from a MediaPlayer
+        if playerId:
+            track = self._getTrack(playerId, kind)
+            transceiver = self._pc.addTransceiver(track)
 
-        elif request.method == "handler.replaceTrack":
-            data = request.data
-            localId = data.get("localId")
-            if localId is None:
-                raise TypeError("missing data.localId")
+        # sending a track which is a remote/receiving track
+        elif recvTrackId:
+            track = self._getRemoteTrack(recvTrackId, kind)
+            transceiver = self._pc.addTransceiver(track)
 
+        else:
+            raise TypeError("missing data.playerId or data.recvTrackId")
+
+        # store transceiver in the dictionary
+        self._sendTransceivers[localId] = transceiver
+        self._updateTransceiversByMid()
+
+    async def _removeTrack(self, request: Request) -> Any:
+        data = request.data
+        try:
+            localId = data["localId"]
+        except KeyError:
+            raise TypeError("missing data.localId")
+
+        transceiver = self._sendTransceivers[localId]
+        transceiver.direction = "inactive"
+        transceiver.sender.replaceTrack(None)
+
+        # NOTE: do not remove transceiver from the dictionary
+
+    async def _replaceTrack(self, request: Request) -> Any:
+        data = request.data
+        try:
+            localId = data["localId"]
+        except KeyError:
+            raise TypeError("missing data.localId")
+        try:
             kind = data["kind"]
-            playerId = data.get("playerId")
-            recvTrackId = data.get("recvTrackId")
-            transceiver = self._sendTransceivers[localId]
-
-            # sending a track got from a MediaPlayer
-            if playerId:
-                track = self._getTrack(playerId, kind)
-
-            # sending a track which is a remote/receiving track
-            elif recvTrackId:
-                track = self._getRemoteTrack(recvTrackId, kind)
-
-            else:
-                raise TypeError("missing data.playerId or data.recvTrackId")
-
-            transceiver.sender.replaceTrack(track)
-
-        elif request.method == "handler.getTransportStats":
-            result = {}
-            stats = await self._pc.getStats()
-            for key in stats:
-                type = stats[key].type
-                if type == "inbound-rtp":
-                    result[key] = self._serializeInboundStats(stats[key])
-                elif type == "outbound-rtp":
-                    result[key] = self._serializeOutboundStats(stats[key])
-                elif type == "remote-inbound-rtp":
-                    result[key] = self._serializeRemoteInboundStats(stats[key])
-                elif type == "remote-outbound-rtp":
-                    result[key] = self._serializeRemoteOutboundStats(stats[key])
-                elif type == "transport":
-                    result[key] = self._serializeTransportStats(stats[key])
-
-            return result
-
-        elif request.method == "handler.getSenderStats":
-            data = request.data
-            mid = data.get("mid")
-            if mid is None:
-                raise TypeError("missing data.mid")
-
-            transceiver = self._getTransceiverByMid(mid)
-            sender = transceiver.sender
-            result = {}
-            stats = await sender.getStats()
-            for key in stats:
-                type = stats[key].type
-                if type == "outbound-rtp":
-                    result[key] = self._serializeOutboundStats(stats[key])
-                elif type == "remote-inbound-rtp":
-                    result[key] = self._serializeRemoteInboundStats(stats[key])
-                elif type == "transport":
-                    result[key] = self._serializeTransportStats(stats[key])
-
-            return result
-
-        elif request.method == "handler.getReceiverStats":
-            data = request.data
-            mid = data.get("mid")
-            if mid is None:
-                raise TypeError("missing data.mid")
-
-            transceiver = self._getTransceiverByMid(mid)
-            receiver = transceiver.receiver
-            result = {}
-            stats = await receiver.getStats()
-            for key in stats:
-                type = stats[key].type
-                if type == "inbound-rtp":
-                    result[key] = self._serializeInboundStats(stats[key])
-                elif type == "remote-outbound-rtp":
-                    result[key] = self._serializeRemoteOutboundStats(stats[key])
-                elif type == "transport":
-                    result[key] = self._serializeTransportStats(stats[key])
-
-            return result
-
-        elif request.method == "handler.createDataChannel":
-            internal = request.internal
-            dataChannelId = internal.get("dataChannelId")
-            data = request.data
-            id = data.get("id")
-            ordered = data.get("ordered")
-            maxPacketLifeTime = data.get("maxPacketLifeTime")
-            maxRetransmits = data.get("maxRetransmits")
-            label = data.get("label")
-            protocol = data.get("protocol")
-            dataChannel = self._pc.createDataChannel(
-                negotiated=True,
-                id=id,
-                ordered=ordered,
-                maxPacketLifeTime=maxPacketLifeTime,
-                maxRetransmits=maxRetransmits,
-                label=label,
-                protocol=protocol
-            )
+        except KeyError:
+            raise TypeError("missing data.kind")
+        playerId = data.get("playerId")
+        recvTrackId = data.get("recvTrackId")
+        transceiver = self._sendTransceivers[localId]
 
-            # store datachannel in the dictionary
-            self._dataChannels[dataChannelId] = dataChannel
-
-            @dataChannel.on("open")  # type: ignore
-            async def on_open() -> None:
-                await self._channel.notify(dataChannelId, "open")
-
-            @dataChannel.on("closing")  # type: ignore
-            async def on_closing() -> None:
-                await self._channel.notify(dataChannelId, "closing")
-
-            @dataChannel.on("close")  # type: ignore
-            async def on_close() -> None:
-                # NOTE: After calling dataChannel.close() aiortc emits "close" event
-                # on the dataChannel. Probably it shouldn't do it. So caution.
-                try:
-                    del self._dataChannels[dataChannelId]
-                    await self._channel.notify(dataChannelId, "close")
-                except KeyError:
-                    pass
-
-            @dataChannel.on("message")  # type: ignore
-            async def on_message(message) -> None:
-                if isinstance(message, str):
-                    await self._channel.notify(dataChannelId, "message", message)
-                if isinstance(message, bytes):
-                    message_bytes = base64.b64encode(message)
-                    await self._channel.notify(
-                        dataChannelId, "binary", str(message_bytes))
-
-            @dataChannel.on("bufferedamountlow")  # type: ignore
-            async def on_bufferedamountlow() -> None:
-                await self._channel.notify(dataChannelId, "bufferedamountlow")
+        # sending a track got from a MediaPlayer
+        if playerId:
+            track = self._getTrack(playerId, kind)
 
-            return {
-                "streamId": dataChannel.id,
-                "ordered": dataChannel.ordered,
-                "maxPacketLifeTime": dataChannel.maxPacketLifeTime,
-                "maxRetransmits": dataChannel.maxRetransmits,
-                "label": dataChannel.label,
-                "protocol": dataChannel.protocol,
-                # status fields
-                "readyState": dataChannel.readyState,
-                "bufferedAmount": dataChannel.bufferedAmount,
-                "bufferedAmountLowThreshold": dataChannel.bufferedAmountLowThreshold
-            }
+        # sending a track which is a remote/receiving track
+        elif recvTrackId:
+            track = self._getRemoteTrack(recvTrackId, kind)
 
         else:
-            raise TypeError("unknown request method")
-
-    async def processNotification(self, notification: Notification) -> None:
-        if notification.event == "enableTrack":
-            Logger.warning("handler: enabling track not implemented")
-
-        elif notification.event == "disableTrack":
-            Logger.warning("handler: disabling track not implemented")
-
-        elif notification.event == "datachannel.send":
-            internal = notification.internal
-            dataChannelId = internal.get("dataChannelId")
-            if dataChannelId is None:
-                raise TypeError("missing internal.dataChannelId")
-
-            data = notification.data
-            dataChannel = self._dataChannels[dataChannelId]
-            dataChannel.send(data)
-
-            # Good moment to update bufferedAmount in Node.js side
-            await self._channel.notify(
-                dataChannelId, "bufferedamount", dataChannel.bufferedAmount
-            )
-
-        elif notification.event == "datachannel.sendBinary":
-            internal = notification.internal
-            dataChannelId = internal.get("dataChannelId")
-            if dataChannelId is None:
-                raise TypeError("missing internal.dataChannelId")
-
-            data = notification.data
-            dataChannel = self._dataChannels[dataChannelId]
-            dataChannel.send(base64.b64decode(data))
+            raise TypeError("missing data.playerId or data.recvTrackId")
+
+        transceiver.sender.replaceTrack(track)
+
+    async def _getTransportStats(self, request: Request) -> Any:
+        stats = await self._pc.getStats()
+        return self._serializeStats(stats, self._statsSerializers)
+
+    async def _getSenderStats(self, request: Request) -> Any:
+        data = request.data
+        try:
+            mid = data["mid"]
+        except KeyError:
+            raise TypeError("missing data.mid")
+
+        transceiver = self._getTransceiverByMid(mid)
+        sender = transceiver.sender
+        stats = await sender.getStats()
+        return self._serializeStats(stats, self._senderStatsSerializers)
+
+    async def _getReceiverStats(self, request: Request) -> Any:
+        data = request.data
+        try:
+            mid = data["mid"]
+        except KeyError:
+            raise TypeError("missing data.mid")
+
+        transceiver = self._getTransceiverByMid(mid)
+        receiver = transceiver.receiver
+        stats = await receiver.getStats()
+        return self._serializeStats(stats, self._receiverStatsSerializers)
+
+    async def _createDataChannel(self, request: Request) -> Any:
+        internal = request.internal
+        try:
+            dataChannelId = internal["dataChannelId"]
+        except KeyError:
+            raise TypeError("missing internal.dataChannelId")
+        data = request.data
+        id = data.get("id")
+        ordered = data.get("ordered")
+        maxPacketLifeTime = data.get("maxPacketLifeTime")
+        maxRetransmits = data.get("maxRetransmits")
+        label = data.get("label")
+        protocol = data.get("protocol")
+        dataChannel = self._pc.createDataChannel(
+            negotiated=True,
+            id=id,
+            ordered=ordered,
+            maxPacketLifeTime=maxPacketLifeTime,
+            maxRetransmits=maxRetransmits,
+            label=label,
+            protocol=protocol
+        )
 
-            # Good moment to update bufferedAmount in Node.js side
-            await self._channel.notify(
-                dataChannelId, "bufferedamount", dataChannel.bufferedAmount
-            )
+        # store datachannel in the dictionary
+        self._dataChannels[dataChannelId] = dataChannel
+        # Node.js side gets the initial bufferedAmount in the response
+        self._notifiedBufferedAmounts[dataChannelId] = dataChannel.bufferedAmount
 
-        elif notification.event == "datachannel.close":
-            internal = notification.internal
-            dataChannelId = internal.get("dataChannelId")
-            if dataChannelId is None:
-                raise TypeError("missing internal.dataChannelId")
+        @dataChannel.on("open")  # type: ignore
+        async def on_open() -> None:
+            await self._channel.notify(dataChannelId, "open")
 
-            dataChannel = self._dataChannels.get(dataChannelId)
-            if dataChannel is None:
-                return
+        @dataChannel.on("closing")  # type: ignore
+        async def on_closing() -> None:
+            await self._channel.notify(dataChannelId, "closing")
 
+        @dataChannel.on("close")  # type: ignore
+        async def on_close() -> None:
             # NOTE: After calling dataChannel.close() aiortc emits "close" event
             # on the dataChannel. Probably it shouldn't do it. So caution.
             try:
                 del self._dataChannels[dataChannelId]
+                self._notifiedBufferedAmounts.pop(dataChannelId, None)
+                await self._channel.notify(dataChannelId, "close")
             except KeyError:
                 pass
 
-            dataChannel.close()
+        @dataChannel.on("message")  # type: ignore
+        async def on_message(message) -> None:
+            if isinstance(message, str):
+                await self._channel.notify(dataChannelId, "message", message)
+            if isinstance(message, bytes):
+                await self._channel.notifyBinary(dataChannelId, "binary", message)
+
+        @dataChannel.on("bufferedamountlow")  # type: ignore
+        async def on_bufferedamountlow() -> None:
+            # send the drained value along so Node.js side gets it updated
+            bufferedAmount = dataChannel.bufferedAmount
+            if dataChannelId in self._dataChannels:
+                self._notifiedBufferedAmounts[dataChannelId] = bufferedAmount
+            await self._channel.notify(
+                dataChannelId, "bufferedamountlow", bufferedAmount)
 
-        elif notification.event == "datachannel.setBufferedAmountLowThreshold":
-            internal = notification.internal
-            dataChannelId = internal.get("dataChannelId")
-            if dataChannelId is None:
-                raise TypeError("missing internal.dataChannelId")
+        return {
+            "streamId": dataChannel.id,
+            "ordered": dataChannel.ordered,
+            "maxPacketLifeTime": dataChannel.maxPacketLifeTime,
+            "maxRetransmits": dataChannel.maxRetransmits,
+            "label": dataChannel.label,
+            "protocol": dataChannel.protocol,
+            # status fields
+            "readyState": dataChannel.readyState,
+            "bufferedAmount": dataChannel.bufferedAmount,
+            "bufferedAmountLowThreshold": dataChannel.bufferedAmountLowThreshold
+        }
 
-            value = notification.data
-            dataChannel = self._dataChannels[dataChannelId]
-            dataChannel.bufferedAmountLowThreshold = value
+    """
+    Notification handlers
+    """
 
-        else:
-            raise TypeError("unknown notification event")
+    async def _enableTrack(self, notification: Notification) -> None:
+        Logger.warning("handler: enabling track not implemented")
+
+    async def _disableTrack(self, notification: Notification) -> None:
+        Logger.warning("handler: disabling track not implemented")
+
+    async def _dataChannelSend(self, notification: Notification) -> None:
+        internal = notification.internal
+        try:
+            dataChannelId = internal["dataChannelId"]
+        except KeyError:
+            raise TypeError("missing internal.dataChannelId")
+
+        data = notification.data
+        dataChannel = self._dataChannels[dataChannelId]
+        dataChannel.send(data)
+
+        await self._notifyBufferedAmount(dataChannelId, dataChannel)
+
+    async def _dataChannelSendBinary(self, notification: Notification) -> None:
+        internal = notification.internal
+        try:
+            dataChannelId = internal["dataChannelId"]
+        except KeyError:
+            raise TypeError("missing internal.dataChannelId")
+
+        data = notification.data
+        dataChannel = self._dataChannels[dataChannelId]
+        dataChannel.send(data)
+
+        await self._notifyBufferedAmount(dataChannelId, dataChannel)
+
+    async def _dataChannelClose(self, notification: Notification) -> None:
+        internal = notification.internal
+        try:
+            dataChannelId = internal["dataChannelId"]
+        except KeyError:
+            raise TypeError("missing internal.dataChannelId")
+
+        dataChannel = self._dataChannels.get(dataChannelId)
+        if dataChannel is None:
+            return
+
+        # NOTE: After calling dataChannel.close() aiortc emits "close" event
+        # on the dataChannel. Probably it shouldn't do it. So caution.
+        try:
+            del self._dataChannels[dataChannelId]
+        except KeyError:
+            pass
+
+        self._notifiedBufferedAmounts.pop(dataChannelId, None)
+        dataChannel.close()
+
+    async def _dataChannelSetBufferedAmountLowThreshold(self, notification: Notification) -> None:
+        internal = notification.internal
+        try:
+            dataChannelId = internal["dataChannelId"]
+        except KeyError:
+            raise TypeError("missing internal.dataChannelId")
+
+        value = notification.data
+        dataChannel = self._dataChannels[dataChannelId]
+        dataChannel.bufferedAmountLowThreshold = value
 
     """
     Helper functions
     """
 
+    async def _notifyBufferedAmount(
+        self, dataChannelId: str, dataChannel: RTCDataChannel
+    ) -> None:
+        # notify just when the value doubles or halves since last notified one
+        bufferedAmount = dataChannel.bufferedAmount
+        notifiedBufferedAmount = self._notifiedBufferedAmounts.get(dataChannelId, 0)
+        if (
+            bufferedAmount > 2 * notifiedBufferedAmount
+            or bufferedAmount < notifiedBufferedAmount // 2
+        ):
+            self._notifiedBufferedAmounts[dataChannelId] = bufferedAmount
+            await self._channel.notify(
+                dataChannelId, "bufferedamount", bufferedAmount)
+
+    def _updateTransceiversByMid(self) -> None:
+        self._transceiversByMid = {
+            transceiver.mid: transceiver
+            for transceiver in self._pc.getTransceivers()
+            if transceiver.mid is not None
+        }
+
     def _getTransceiverByMid(self, mid: str) -> Optional[RTCRtpTransceiver]:
-        return next(
-            filter(lambda x: x.mid == mid, self._pc.getTransceivers()), None
-        )
+        transceiver = self._transceiversByMid.get(mid)
+        if transceiver is not None:
+            return transceiver
+
+        # fallback to a lookup in case the MID was assigned after the last update
+        for transceiver in self._pc.getTransceivers():
+            if transceiver.mid == mid:
+                return transceiver
+
+        return None
+
+    def _serializeStats(
+        self,
+        stats: RTCStatsReport,
+        serializers: Dict[str, Callable[[RTCStatsReport], Dict[str, Any]]]
+    ) -> Dict[str, Any]:
+        result = {}
+        for key, value in stats.items():
+            serializer = serializers.get(value.type)
+            if serializer is not None:
+                result[key] = serializer(value)
+
+        return result
 
     def _serializeInboundStats(self, stats: RTCStatsReport) -> Dict[str, Any]:
         return {
@@ -488,7 +581,7 @@ class Handler:
     def _serializeRemoteInboundStats(self, stats: RTCStatsReport) -> Dict[str, Any]:
         return {
             # RTCStats
-            "timestamp": stats.timestamp.timestamp(),
+            "timestamp": _toRemoteTimestamp(stats.timestamp),
             "type": stats.type,
             "id": stats.id,
             # RTCStreamStats
@@ -507,7 +600,7 @@ class Handler:
     def _serializeRemoteOutboundStats(self, stats: RTCStatsReport) -> Dict[str, Any]:
         return {
             # RTCStats
-            "timestamp": stats.timestamp.timestamp(),
+            "timestamp": _toRemoteTimestamp(stats.timestamp),
             "type": stats.type,
             "id": stats.id,
             # RTCStreamStats
@@ -518,7 +611,7 @@ class Handler:
             "packetsSent": stats.packetsSent,
             "bytesSent": stats.bytesSent,
             # RTCRemoteOutboundRtpStreamStats
-            "remoteTimestamp": stats.remoteTimestamp.timestamp()
+            "remoteTimestamp": _toRemoteTimestamp(stats.remoteTimestamp)
         }
 
     def _serializeTransportStats(self, stats: RTCStatsReport) -> Dict[str, Any]:
@@ -1,18 +1,39 @@
 import argparse
+import json
 import traceback
 import asyncio
 from os import getpid
-from typing import Any, Dict
-from aiortc import RTCConfiguration, RTCIceServer, RTCPeerConnection
-from aiortc.contrib.media import MediaPlayer, MediaStreamTrack
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
+from aiortc import (
+    MediaStreamTrack,
+    RTCConfiguration,
+    RTCIceServer,
+    RTCPeerConnection
+)
 from channel import Request, Notification, Channel
 from handler import Handler
 from logger import Logger
 
+if TYPE_CHECKING:
+    # imported on first use at runtime, most workers never create a player
+    from aiortc.contrib.media import MediaPlayer, MediaRelay
+
+try:
+    # libuv based event loop if available, faster socket and UDP I/O
+    import uvloop
+except ImportError:
+    uvloop = None
+
 # File descriptors to communicate with the Node.js process
 READ_FD = 3
 WRITE_FD = 4
 
+# Process id of this worker, it does not change during its lifetime
+PID = getpid()
+
+# Key of a shared device player: format, device and serialized options
+DeviceKey = Tuple[Optional[str], str, str]
+
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(
@@ -33,26 +54,93 @@ if __name__ == "__main__":
     Initialization
     """
     # dictionary of players indexed by id
-    players: Dict[str, MediaPlayer] = ({})
+    players: Dict[str, "MediaPlayer"] = ({})
+    # dictionary of the tracks of each player id indexed by kind
+    playerTracks: Dict[str, Dict[str, MediaStreamTrack]] = ({})
+    # dictionary of shared device players and their relays indexed by key
+    devicePlayers: Dict[DeviceKey, Tuple["MediaPlayer", "MediaRelay"]] = ({})
+    # dictionary of device player keys indexed by player id
+    devicePlayerKeys: Dict[str, DeviceKey] = ({})
     # dictionary of handlers indexed by id
     handlers: Dict[str, Handler] = ({})
     # dictionary of receiving tracks indexed by id
     recvTracks = dict()  # type: Dict[str, MediaStreamTrack]
 
     # get/create event loop
-    loop = asyncio.get_event_loop()
+    loop: asyncio.AbstractEventLoop
+    if uvloop is not None:
+        loop = uvloop.new_event_loop()
+        asyncio.set_event_loop(loop)
+    else:
+        loop = asyncio.get_event_loop()
 
     # create channel
     channel = Channel(loop, READ_FD, WRITE_FD)
 
+    # SDP offer with the RTP capabilities of aiortc, it just depends on the
+    # aiortc build so it is computed once
+    rtpCapabilitiesSdp: Optional[str] = None
+    rtpCapabilitiesLock = asyncio.Lock()
+
     def getTrack(playerId: str, kind: str) -> MediaStreamTrack:
-        player = players[playerId]
-        track = player.audio if kind == "audio" else player.video
+        track = playerTracks[playerId].get(kind)
         if not track:
             raise Exception("no track found")
 
         return track
 
+    def releaseTrack(playerId: str, kind: str) -> None:
+        # stopped tracks are kept so they are still dumped and got as ended
+        track = playerTracks[playerId].get(kind)
+        if track is None or track.readyState == "ended":
+            return
+
+        track.stop()
+
+        # a track of a non shared player is the player track itself
+        key = devicePlayerKeys.get(playerId)
+        if key is None:
+            return
+
+        # stop the device track once its last user releases it, the key may
+        # already belong to a newer player if this one left the pool
+        player = players[playerId]
+        for otherPlayerId in devicePlayerKeys:
+            if players[otherPlayerId] is not player:
+                continue
+
+            otherTrack = playerTracks[otherPlayerId].get(kind)
+            if otherTrack is not None and otherTrack.readyState != "ended":
+                return
+
+        if kind == "audio" and player.audio:
+            player.audio.stop()
+        elif kind == "video" and player.video:
+            player.video.stop()
+
+        # once a track is stopped the player cannot be shared anymore
+        entry = devicePlayers.get(key)
+        if entry is not None and entry[0] is player:
+            del devicePlayers[key]
+
+    async def getRtpCapabilities() -> str:
+        global rtpCapabilitiesSdp
+
+        if rtpCapabilitiesSdp is not None:
+            return rtpCapabilitiesSdp
+
+        # avoid computing it twice if requested again meanwhile
+        async with rtpCapabilitiesLock:
+            if rtpCapabilitiesSdp is None:
+                pc = RTCPeerConnection()
+                pc.addTransceiver("audio", "sendonly")
+                pc.addTransceiver("video", "sendonly")
+                offer = await pc.createOffer()
+                await pc.close()
+                rtpCapabilitiesSdp = offer.sdp
+
+        return rtpCapabilitiesSdp
+
     def addRemoteTrack(track: MediaStreamTrack) -> None:
         recvTracks[track.id] = track
 
@@ -70,26 +158,28 @@ if __name__ == "__main__":
 
         if request.method == "dump":
             result = {
-                "pid": getpid(),
+                "pid": PID,
                 "players": [],
                 "handlers": []
             }
 
-            for playerId, player in players.items():
+            for playerId, tracks in playerTracks.items():
                 playerDump = {
                     "id": playerId
                 }  # type: Dict[str, Any]
-                if player.audio:
+                audioTrack = tracks.get("audio")
+                if audioTrack:
                     playerDump["audioTrack"] = {
-                        "id": player.audio.id,
-                        "kind": player.audio.kind,
-                        "readyState": player.audio.readyState
+                        "id": audioTrack.id,
+                        "kind": audioTrack.kind,
+                        "readyState": audioTrack.readyState
                     }
-                if player.video:
+                videoTrack = tracks.get("video")
+                if videoTrack:
                     playerDump["videoTrack"] = {
-                        "id": player.video.id,
-                        "kind": player.video.kind,
-                        "readyState": player.video.readyState
+                        "id": videoTrack.id,
+                        "kind": videoTrack.kind,
+                        "readyState": videoTrack.readyState
                     }
                 result["players"].append(playerDump)  # type: ignore
 
@@ -102,29 +192,58 @@ if __name__ == "__main__":
             internal = request.internal
             playerId = internal["playerId"]
             data = request.data
-            player = MediaPlayer(
-                data["file"],
-                data["format"] if "format" in data else None,
-                data["options"] if "options" in data else None
-            )
+
+            from aiortc.contrib.media import MediaPlayer, MediaRelay
+
+            # a device cannot be captured twice, so share its player
+            key = None
+            entry = None
+            if data.get("source") == "device":
+                key = (
+                    data.get("format"),
+                    data["file"],
+                    json.dumps(data.get("options"), sort_keys=True)
+                )
+                entry = devicePlayers.get(key)
+
+            if entry is not None:
+                player, relay = entry
+            else:
+                player = MediaPlayer(
+                    data["file"],
+                    data["format"] if "format" in data else None,
+                    data["options"] if "options" in data else None
+                )
+                if key is not None:
+                    relay = MediaRelay()
+                    devicePlayers[key] = (player, relay)
 
             # store the player in the map
             players[playerId] = player
 
+            # each user of a shared device player gets its own relayed tracks,
+            # otherwise they would compete for the frames of the same track
+            tracks = {}
+            for kind, track in (("audio", player.audio), ("video", player.video)):
+                if not track:
+                    continue
+                if key is not None:
+                    track = relay.subscribe(track, buffered=False)
+                tracks[kind] = track
+
+            playerTracks[playerId] = tracks
+            if key is not None:
+                devicePlayerKeys[playerId] = key
+
             result = {}
-            if player.audio:
-                result["audioTrackId"] = player.audio.id
-            if player.video:
-                result["videoTrackId"] = player.video.id
+            if "audio" in tracks:
+                result["audioTrackId"] = tracks["audio"].id
+            if "video" in tracks:
+                result["videoTrackId"] = tracks["video"].id
             return result
 
         elif request.method == "getRtpCapabilities":
-            pc = RTCPeerConnection()
-            pc.addTransceiver("audio", "sendonly")
-            pc.addTransceiver("video", "sendonly")
-            offer = await pc.createOffer()
-            await pc.close()
-            return offer.sdp
+            return await getRtpCapabilities()
 
         elif request.method == "createHandler":
             internal = request.internal
@@ -174,30 +293,25 @@ if __name__ == "__main__":
         if notification.event == "player.close":
             internal = notification.internal
             playerId = internal["playerId"]
-            player = players.get(playerId)
-            if player is None:
+            if playerId not in players:
                 return
 
-            if player.audio:
-                player.audio.stop()
-            if player.video:
-                player.video.stop()
+            releaseTrack(playerId, "audio")
+            releaseTrack(playerId, "video")
 
             del players[playerId]
+            del playerTracks[playerId]
+            devicePlayerKeys.pop(playerId, None)
 
         elif notification.event == "player.stopTrack":
             internal = notification.internal
             playerId = internal["playerId"]
             data = notification.data
             kind = data["kind"]
-            player = players.get(playerId)
-            if player is None:
+            if playerId not in players:
                 return
 
-            if kind == "audio" and player.audio:
-                player.audio.stop()
-            elif kind == "video" and player.video:
-                player.video.stop()
+            releaseTrack(playerId, kind)
 
         elif notification.event == "handler.close":
             internal = notification.internal
@@ -221,7 +335,7 @@ if __name__ == "__main__":
         Logger.debug("worker: run()")
 
         # tell the Node process that we are running
-        await channel.notify(str(getpid()), "running")
+        await channel.notify(str(PID), "running")
 
         while True:
             try:
@@ -269,12 +383,18 @@ if __name__ == "__main__":
         await channel.close()
 
         # close all players
+        for tracks in playerTracks.values():
+            for track in tracks.values():
+                track.stop()
         for player in players.values():
             if player.audio:
                 player.audio.stop()
             if player.video:
                 player.video.stop()
         players.clear()
+        playerTracks.clear()
+        devicePlayers.clear()
+        devicePlayerKeys.clear()
 
         # close all handlers
         for handler in handlers.values():